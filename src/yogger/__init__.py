@@ -1,12 +1,47 @@
 # Copyright Nicholas Londowski 2022. Apache 2.0 license, see LICENSE file.
-from .base import (
-    Yogger,
-    pformat,
-    install,
-    configure,
-    dump,
-    dumps,
-    dump_on_exception,
-)
-
 __version__ = "0.0.4rc2"
+
+# Names resolved from '.base' on first access (PEP 562)
+# NOTE: Keeps 'import yogger' cheap for callers that never log or dump.
+_LAZY = {
+    "Yogger",
+    "pformat",
+    "lazy_pformat",
+    "install",
+    "configure",
+    "dump",
+    "dumps",
+    "dump_on_exception",
+}
+
+# NOTE: Star-imports resolve each name through '__getattr__'.
+__all__ = sorted(_LAZY)
+
+# NOTE: Recognized by type checkers without importing 'typing' at runtime (removed so it is not exported).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .base import (
+        Yogger,
+        configure,
+        dump,
+        dump_on_exception,
+        dumps,
+        install,
+        lazy_pformat,
+        pformat,
+    )
+del TYPE_CHECKING
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        from . import base
+
+        value = getattr(base, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY)
@@ -2,15 +2,16 @@
 import os
 import sys
 import io
-import sys
 import logging
 import collections
 import contextlib
 import dataclasses
+import functools
 import inspect
 import tempfile
+import types
 
-from typing import Any
+from typing import Any, Callable, Iterator
 
 # Check if supported external packages are installed
 # NOTE: These are not required, but will be used during formatting if found.
@@ -18,13 +19,26 @@ try:
     from requests import Request, PreparedRequest, Response
     from requests.exceptions import RequestException
 
+    _RESPONSE_TYPES = (Response,)
+    _REQUEST_TYPES = (PreparedRequest, Request)
+    _REQUEST_EXCEPTION_TYPES = (RequestException,)
     _has_requests_package = True
 except (NameError, ModuleNotFoundError):
     Request = Any
     Response = Any
     RequestException = Exception
+    # NOTE: Empty so that no value is ever matched as a Requests object.
+    _RESPONSE_TYPES = ()
+    _REQUEST_TYPES = ()
+    _REQUEST_EXCEPTION_TYPES = ()
     _has_requests_package = False
 
+# Containers of objects represented item by item (bound once rather than rebuilt per call)
+_CONTAINER_TYPES = (list, tuple, set, collections.deque)
+# Items that allow a container to be represented on a single line
+_SIMPLE_TYPES = (int, float, str, bytes, type(None))
+_SIMPLE_TYPE_SET = frozenset((*_SIMPLE_TYPES, bool))
+
 
 _logger = logging
 
@@ -34,27 +48,89 @@ _global_dump_locals = False
 
 
 # NOTE: Support for colors will be added for Windows later.
-_LOG_FMT = "[ {asctime}.{msecs:04.0f}  \33[1m{levelname}\33[0m  {name} ]  {message}"
+_LOG_FMT = "[ %(asctime)s.%(msecs)04.0f  \33[1m%(levelname)s\33[0m  %(name)s ]  %(message)s"
 _DATE_FMT = "%Y-%m-%d %H:%M:%S"
-_DUMP_MSG = "".join(
-    (
-        "\33[1m" if sys.platform != "win32" else "",
-        'Dumped stack and locals to "{name}"',
-        "\33[0m" if sys.platform != "win32" else "",
-        "\nCopy and paste the following to view:\n    cat '{name}'\n",
-    )
-)
+# Shared by every handler added with 'configure' (the format is parsed once)
+_FORMATTER = logging.Formatter(fmt=_LOG_FMT, datefmt=_DATE_FMT)
+
+# Escape sequences for bold text, empty where unsupported
+_BOLD = "\33[1m" if sys.platform != "win32" else ""
+_RESET = "\33[0m" if sys.platform != "win32" else ""
+_DUMP_MSG = f"{_BOLD}Dumped stack and locals to \"{{name}}\"{_RESET}\nCopy and paste the following to view:\n    cat '{{name}}'\n"
+# Buffer size for dump files (dumps smaller than this reach the file in a single write)
+_DUMP_BUFFER_SIZE = 1 << 16
+# Literal segments around each '{name}' slot, split once so messages are built without str.format
+_DUMP_MSG_PARTS = tuple(_DUMP_MSG.split("{name}"))
+
+# Lightweight stand-in for inspect.FrameInfo (same field order for index access)
+_FrameInfo = collections.namedtuple("_FrameInfo", ("frame", "filename", "lineno", "function"))
+
+
+def _fast_stack(skip: int) -> list[_FrameInfo]:
+    """Walk the Interpreter Stack Without Reading Source Context
+
+    Unlike 'inspect.stack', no source lines are looked up for each frame.
+
+    Args:
+        skip (int): Number of frames to skip, counting this function as frame 0.
+
+    Returns:
+        list[_FrameInfo]: Frames from the innermost (after skipping) to the outermost.
+    """
+    try:
+        frame = sys._getframe(skip)
+    except ValueError:
+        # Call stack is not deep enough
+        return []
+
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(_FrameInfo(frame, code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    return stack
+
+
+def _fast_trace(tb: types.TracebackType | None) -> list[_FrameInfo]:
+    """Walk a Traceback Without Reading Source Context
+
+    Lightweight equivalent of 'inspect.trace' for an already caught traceback.
+
+    Args:
+        tb (types.TracebackType | None): Traceback to walk.
+
+    Returns:
+        list[_FrameInfo]: Frames from the outermost to where the exception was raised.
+    """
+    trace = []
+    while tb is not None:
+        frame = tb.tb_frame
+        code = frame.f_code
+        trace.append(_FrameInfo(frame, code.co_filename, tb.tb_lineno, code.co_name))
+        tb = tb.tb_next
+    return trace
+
+
+# Unbound base method, called directly to avoid creating a 'super' proxy on every log call
+_base_log = logging.Logger.log
+
 
 class Yogger(logging.Logger):
     def _log_with_stack(self, level: int, *args: tuple, **kwargs: dict):
-        super().log(level, *args, **kwargs)
+        # Avoid walking the stack for records that would be discarded
+        if not self.isEnabledFor(level):
+            return
+
+        _base_log(self, level, *args, **kwargs)
 
         # Dump current stack if 'dump_locals' was set to True
         if _global_dump_locals:
-            stack = inspect.stack()
-            if len(stack) > 2:
-                name = _dump(stack=stack[2:][::-1], e=None, dump_path=None)
-                super().log(level, _DUMP_MSG.format(name=name))
+            # Skip this method and the public logging method that called it
+            stack = _fast_stack(3)
+            if stack:
+                stack.reverse()
+                name = _dump(stack=stack, e=None, dump_path=None)
+                _base_log(self, level, name.join(_DUMP_MSG_PARTS))
 
     def warning(self, *args: tuple, **kwargs: dict):
         self._log_with_stack(logging.WARNING, *args, **kwargs)
@@ -69,7 +145,7 @@ class Yogger(logging.Logger):
         if level >= logging.WARNING:
             self._log_with_stack(level, *args, **kwargs)
         else:
-            super().log(level, *args, **kwargs)
+            _base_log(self, level, *args, **kwargs)
 
 def install() -> None:
     """Install the Yogger Logger Class and Instantiate the Global Logger"""
@@ -79,165 +155,289 @@ def install() -> None:
     _logger = logging.getLogger(__name__)
 
 
-def _apply_line_continuation(msg: str) -> str:
+def _apply_line_continuation(obj_repr: str, indent: str = "") -> str:
     """Prefix with a Backslash and Indent if Contains Any Newlines
 
     Args:
-        msg (str): Representation to apply line continuation to.
+        obj_repr (str): Representation to apply line continuation to.
+        indent (str, optional): Indent of the line the representation starts on. Defaults to "".
 
     Returns:
         str: String with line continuation and indent applied.
     """
-    if "\n" in msg:
-        "\\\n  " + msg.replace("\n", "\n  ")
-    return msg
+    if obj_repr.find("\n") < 0:
+        return obj_repr
+    newline = "\n" + indent + "  "
+    return "\\" + newline + obj_repr.replace("\n", newline)
 
 
-def _requests_request_repr(name: str, request: Request) -> str:
-    """Representation of a requests.Request Object
+def _write_requests_request(write: Callable[[str], Any], name: str, request: Request, indent: str) -> None:
+    """Write the Representation of a requests.Request Object
 
     Args:
-        name (str): Name of the Requests response.
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the Requests request, used to name its attributes.
         request (requests.Request): Request object, prepared by the Requests module.
-
-    Returns:
-        str: Formatted representation of a requests.Request object.
+        indent (str): Indent of the line the representation starts on.
     """
-    msg = ""
-    msg += f"{name} = {request!r}"
-    msg += f"\n  {name}.method = {request.method}"
-    msg += f"\n  {name}.url = {request.url}"
-    msg += f"\n  {name}.headers = "
-    if not request.headers:
+    newline = "\n" + indent
+    write(repr(request))
+    write(f"{newline}  {name}.method = {request.method}")
+    write(f"{newline}  {name}.url = {request.url}")
+    write(f"{newline}  {name}.headers = ")
+    headers = request.headers
+    if not headers:
         # Empty or missing headers
-        msg += f"{request.headers!r}"
+        write(f"{headers!r}")
     else:
-        msg += "\\"
-        for field in request.headers:
-            msg += f'\n    {field} = {pformat("_", request.headers[field])}'
+        write("\\")
+        for field, field_value in headers.items():
+            write(f"{newline}    {field} = ")
+            _pformat_value_into(write, f"{name}.headers[{field!r}]", field_value, indent + "    ")
 
     for attr in ("body", "params", "data"):
-        if hasattr(request, attr) and getattr(request, attr):
-            msg += f"\n  {name}.{attr} = "
-            msg += pformat("_", getattr(request, attr)).replace("\n", "\n  ")
+        # NOTE: PreparedRequest has 'body', while Request has 'params' and 'data'.
+        attr_value = getattr(request, attr, None)
+        if attr_value:
+            write(f"{newline}  {name}.{attr} = ")
+            _pformat_value_into(write, f"{name}.{attr}", attr_value, indent + "  ")
 
-    return msg
 
-
-def _requests_response_repr(
+def _write_requests_response(
+    write: Callable[[str], Any],
     name: str,
     response: Response,
+    indent: str,
     *,
     include_history: bool = True,
-) -> str:
-    """Representation of a requests.Response Object
+) -> None:
+    """Write the Representation of a requests.Response Object
 
     Args:
-        name (str): Name of the Requests response.
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the Requests response, used to name its attributes.
         response (requests.Response): Response object from the Requests module.
-        include_history (bool): Include the request redirect history in the representation (not yet accessable to user). Defaults to True.
-
-    Returns:
-        str: Formatted representation of a requests.Response object.
+        indent (str): Indent of the line the representation starts on.
+        include_history (bool): Include the request redirect history in the representation. Defaults to True.
     """
-    msg = ""
-    msg += f"{name} = {response!r}"
-    msg += f"\n  {name}.url = {response.url}"
-    msg += f"\n  {name}.request = "
-    msg += pformat("_", response.request).replace("\n", "\n  ")
+    newline = "\n" + indent
+    write(repr(response))
+    write(f"{newline}  {name}.url = {response.url}")
+    write(f"{newline}  {name}.request = ")
+    _pformat_value_into(write, f"{name}.request", response.request, indent + "  ")
     if include_history and response.history:
-        msg += f"\n  {name}.history = ["
-        for prev_resp in response.history:
-            msg += "\n    "
-            msg += _requests_response_repr("_", prev_resp, include_history=False).replace("\n", "\n    ")
+        write(f"{newline}  {name}.history = [")
+        for i, prev_resp in enumerate(response.history):
+            write(newline + "    ")
+            _write_requests_response(write, f"{name}.history[{i}]", prev_resp, indent + "    ", include_history=False)
 
-        msg += "\n  ]"
+        write(f"{newline}  ]")
 
-    msg += f"\n  {name}.status_code = {response.status_code}"
-    msg += f"\n  {name}.headers = "
-    if not response.headers:
+    write(f"{newline}  {name}.status_code = {response.status_code}")
+    write(f"{newline}  {name}.headers = ")
+    headers = response.headers
+    if not headers:
         # Empty or missing headers
-        msg += f"{response.headers!r}"
+        write(f"{headers!r}")
     else:
-        msg += "\\"
-        for field in response.headers:
-            msg += f'\n    {field} = {pformat("_", response.headers[field])}'
+        write("\\")
+        for field, field_value in headers.items():
+            write(f"{newline}    {field} = ")
+            _pformat_value_into(write, f"{name}.headers[{field!r}]", field_value, indent + "    ")
 
-    msg += f'\n  {name}.content = {pformat("_", response.content)}'
-    return msg
+    write(f"{newline}  {name}.content = ")
+    _pformat_value_into(write, f"{name}.content", response.content, indent + "  ")
 
 
-def _requests_exception_repr(name: str, e: RequestException) -> str:
-    """Formatted Representation of a requests.exceptions.RequestException
+def _write_requests_exception(write: Callable[[str], Any], name: str, e: RequestException, indent: str) -> None:
+    """Write the Formatted Representation of a requests.exceptions.RequestException
 
     Args:
-        name (str): Name of the Requests Exception.
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the Requests Exception, used to name its attributes.
         e (requests.exceptions.RequestException): Requests exception to represent.
+        indent (str): Indent of the line the representation starts on.
+    """
+    newline = "\n" + indent + "  "
+    write(repr(e))
+    write(newline)
+    _pformat_into(write, f"{name}.request", e.request, indent + "  ")
+    write(newline)
+    _pformat_into(write, f"{name}.response", e.response, indent + "  ")
+
+
+@functools.lru_cache(maxsize=256)
+def _type_header(cls: type) -> str:
+    """Header Used to Represent a Container's Type (Cached per Class)
+
+    Args:
+        cls (type): Class of the container.
 
     Returns:
-        str: Formatted representation of a Requests exception.
+        str: Header in the form '<module.name>'.
     """
-    msg = ""
-    msg += f"{name} = {e!r}"
-    msg += "\n  " + pformat(f"{name}.request", e.request).replace("\n", "\n  ")
-    msg += "\n  " + pformat(f"{name}.response", e.response).replace("\n", "\n  ")
-    return msg
+    return f"<{cls.__module__}.{cls.__name__}>"
 
 
-def _dict_repr(name: str, value: dict) -> str:
-    """Formatted Representation of a Dictionary Variable's Name and Value
+def _write_dict(write: Callable[[str], Any], name: str, value: dict, indent: str) -> None:
+    """Write the Formatted Representation of a Dictionary Variable's Value
 
     Args:
-    name (str): Name of the dict to represent.
-    value (dict): Value to represent.
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the dict to represent, used to name its items.
+        value (dict): Value to represent.
+        indent (str): Indent of the line the representation starts on.
+    """
+    write(_type_header(type(value)))
+    item_indent = indent + "  "
+    for k, v in value.items():
+        write("\n" + item_indent)
+        _pformat_into(write, f"{name}[{k!r}]", v, item_indent)
 
-    Returns:
-        str: Formatted representation of a dictionary variable.
+
+def _write_object_container(write: Callable[[str], Any], name: str, value: collections.abc.Collection, indent: str) -> None:
+    """Write the Formatted Representation of a Container of Object's Value
+
+    Args:
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the collection variable to represent, used to name its items.
+        value (collections.abc.Collection): Value to represent.
+        indent (str): Indent of the line the representation starts on.
     """
-    msg = ""
-    msg += f"{name} = <{type(value).__module__}.{type(value).__name__}>\n  "
-    msg += "\n  ".join(pformat(f"{name}[{k!r}]", v).replace("\n", "\n  ") for k, v in value.items())
-    return msg
+    # NOTE: Exact types are checked in a single C-level pass; isinstance only runs for subclasses (e.g. bool or enums).
+    if _SIMPLE_TYPE_SET.issuperset(map(type, value)) or all(isinstance(v, _SIMPLE_TYPES) for v in value):
+        # Single line (all values are primitives with a single-line repr)
+        write(repr(value))
+        return
+
+    # Multiple lines (not all values are primitives)
+    write(_type_header(type(value)))
+    item_indent = indent + "  "
+    for i, v in enumerate(value):
+        write("\n" + item_indent)
+        _pformat_into(write, f"{name}[{i}]", v, item_indent)
 
 
-def _object_container_repr(name: str, value: collections.abc.Collection) -> str:
-    """Formatted Representation of a Container of Object's Name and Value
+@functools.lru_cache(maxsize=256)
+def _dataclass_field_names(cls: type) -> tuple[str, ...]:
+    """Names of a Dataclass's Fields (Cached per Class)
 
     Args:
-    name (str): Name of the collection variable to represent.
-    value (dict): Value to represent.
+        cls (type): Dataclass to get the field names of.
 
     Returns:
-        str: Formatted representation of a collection variable variable.
+        tuple[str, ...]: Names of the fields, in definition order.
     """
-    msg = ""
-    if all(isinstance(v, (int, str)) for v in value):
-        # Single line (all values are int or str)
-        msg = f"{name} = {value!r}"
-    else:
-        # Multiple lines (not all values are int or str)
-        msg += f"{name} = <{type(value).__module__}.{type(value).__name__}>\n  "
-        msg += "\n  ".join(pformat(f"{name}[{i}]", v).replace("\n", "\n  ") for i, v in enumerate(value))
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _write_dataclass(write: Callable[[str], Any], name: str, value: Any, indent: str) -> None:
+    """Write the Formatted Representation of a Dataclass Variable's Value
+
+    Args:
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the dataclass to represent, used to name its fields.
+        value (Any): Value to represent.
+        indent (str): Indent of the line the representation starts on.
+    """
+    value_type = type(value)
+    write(_type_header(value_type))
+    field_indent = indent + "  "
+    for field_name in _dataclass_field_names(value_type):
+        write("\n" + field_indent)
+        _pformat_into(write, f"{name}.{field_name}", getattr(value, field_name), field_indent)
 
-    # Apply line continuation if contains any newlines
-    msg = _apply_line_continuation(msg)
-    return msg
 
+def _write_repr(write: Callable[[str], Any], name: str, value: Any, indent: str) -> None:
+    """Write the Formatted Representation of a Variable's Value Using Its repr
 
-def _dataclass_repr(name: str, value: dict) -> str:
-    """Formatted Representation of a Dataclass Variable's Name and Value
+    Args:
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the variable to represent (unused).
+        value (Any): Value to represent.
+        indent (str): Indent of the line the representation starts on, applied after every newline.
+    """
+    # Apply line continuation if the representation contains any newlines
+    write(_apply_line_continuation(repr(value), indent))
+
+
+# Handlers for exact types, consulted before '_resolve_handler' in '_pformat_value_into'
+_PFORMAT_DISPATCH = {
+    dict: _write_dict,
+    list: _write_object_container,
+    tuple: _write_object_container,
+    set: _write_object_container,
+    collections.deque: _write_object_container,
+    # NOTE: The most common local types skip the cached lookup entirely.
+    str: _write_repr,
+    int: _write_repr,
+    bytes: _write_repr,
+    float: _write_repr,
+    bool: _write_repr,
+    type(None): _write_repr,
+}
+# Support for Requests package
+_PFORMAT_DISPATCH.update(dict.fromkeys(_RESPONSE_TYPES, _write_requests_response))
+_PFORMAT_DISPATCH.update(dict.fromkeys(_REQUEST_TYPES, _write_requests_request))
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_handler(cls: type) -> Callable[[Callable[[str], Any], str, Any, str], None]:
+    """Resolve the Handler for Values of a Class Not in the Dispatch Table (Cached per Class)
 
     Args:
-    name (str): Name of the dataclass to represent.
-    value (dict): Value to represent.
+        cls (type): Class of the value to represent.
 
     Returns:
-        str: Formatted representation of a dataclass variable.
+        Callable[[Callable[[str], Any], str, Any, str], None]: Handler used to write the representation.
     """
-    msg = ""
-    msg += f"{name} = <{type(value).__module__}.{type(value).__name__}>\n  "
-    msg += "\n  ".join(pformat(f"{name}.{f.name}", f.name) + " = " + pformat(f"{name}.{f.name}", getattr(value, f.name)).replace("\n", "\n  ") for f in dataclasses.fields(value))
-    return msg
+    if issubclass(cls, _REQUEST_EXCEPTION_TYPES):
+        # Requests exception
+        return _write_requests_exception
+    elif issubclass(cls, dict):
+        # Dictionary
+        return _write_dict
+    elif issubclass(cls, _CONTAINER_TYPES):
+        # Container of objects (list, tuple, set, or deque)
+        return _write_object_container
+    elif dataclasses.is_dataclass(cls):
+        # Dataclass instance (dataclass types themselves fall through)
+        return _write_dataclass
+    # Other (also includes string, bytes, ranges, etc.)
+    return _write_repr
+
+
+def _pformat_value_into(write: Callable[[str], Any], name: str, value: Any, indent: str) -> None:
+    """Write the Formatted Representation of a Variable's Value
+
+    Only the right-hand side is written; the name is used for nested values (e.g. "name[0]").
+
+    Args:
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the variable to represent.
+        value (Any): Value to represent.
+        indent (str): Indent of the line the representation starts on, applied after every newline.
+    """
+    value_type = type(value)
+    handler = _PFORMAT_DISPATCH.get(value_type)
+    if handler is None:
+        handler = _resolve_handler(value_type)
+    handler(write, name, value, indent)
+
+
+def _pformat_into(write: Callable[[str], Any], name: str, value: Any, indent: str) -> None:
+    """Write the Formatted Representation of a Variable's Name and Value
+
+    Nested values are written through the same function with a deeper indent, so no representation is re-indented after the fact.
+
+    Args:
+        write (Callable[[str], Any]): Function used to write each fragment.
+        name (str): Name of the variable to represent.
+        value (Any): Value to represent.
+        indent (str): Indent of the line the representation starts on, applied after every newline.
+    """
+    write(name + " = ")
+    _pformat_value_into(write, name, value, indent)
 
 
 def pformat(name: str, value: Any) -> str:
@@ -250,33 +450,44 @@ def pformat(name: str, value: Any) -> str:
     Returns:
         str: Formatted representation of a variable.
     """
-    # Support for Requests package
-    if _has_requests_package:
-        if type(value) is Response:
-            # Requests response
-            return _requests_response_repr(name, value)
-        if type(value) in (PreparedRequest, Request):
-            # Requests request
-            return _requests_request_repr(name, value)
-        if isinstance(value, RequestException):
-            # Requests exception
-            return _requests_exception_repr(name, value)
-
-    if isinstance(value, dict):
-        # Dictionary
-        return _dict_repr(name, value)
-    if isinstance(value, (list, tuple, set, collections.deque)):
-        # Container of objects (list, tuple, set, or deque)
-        return _object_container_repr(name, value)
-    if dataclasses.is_dataclass(value):
-        # Dataclass
-        return _dataclass_repr(name, value)
+    parts = []
+    _pformat_into(parts.append, name, value, "")
+    return "".join(parts)
 
-    # Other (also includes string, bytes, ranges, etc.)
-    msg = f"{name} = {value!r}"
-    # Apply line continuation if contains any newlines
-    msg = _apply_line_continuation(msg)
-    return msg
+
+class _LazyPFormat:
+    """Formatted Representation of a Variable, Created When First Converted to a String"""
+
+    __slots__ = ("name", "value", "_result")
+
+    def __init__(self, name: str, value: Any):
+        self.name = name
+        self.value = value
+        self._result = None
+
+    def __str__(self) -> str:
+        result = self._result
+        if result is None:
+            result = self._result = pformat(self.name, self.value)
+        return result
+
+    __repr__ = __str__
+
+
+def lazy_pformat(name: str, value: Any) -> _LazyPFormat:
+    """Deferred Formatted Representation of a Variable's Name and Value
+
+    The representation is only created once the returned object is converted to a string (e.g. when a log record is emitted),
+    so no work is done for messages filtered out by the logging level: logger.debug("%s", lazy_pformat("x", x))
+
+    Args:
+        name (str): Name of the variable to represent.
+        value (Any): Value to represent.
+
+    Returns:
+        _LazyPFormat: Object that is formatted as 'pformat(name, value)', created once on first use.
+    """
+    return _LazyPFormat(name, value)
 
 
 def _exception_dumps(*, e: Exception) -> str:
@@ -288,56 +499,90 @@ def _exception_dumps(*, e: Exception) -> str:
     Returns:
         str: Representation of the stack.
     """
-    msg = ""
-    msg += "Exception:\n"
-    msg += f"  {type(e).__module__}.{type(e).__name__}: {e!s}\n"
-    msg += f"  args: {e.args!r}"
-    return msg
+    parts = []
+    parts.append("Exception:\n")
+    parts.append(f"  {type(e).__module__}.{type(e).__name__}: {e!s}\n")
+    parts.append(f"  args: {e.args!r}")
+    return "".join(parts)
 
 
-def _stack_dumps(
+def _package_frames(
     stack: list[inspect.FrameInfo],
     package_name: str | None = None,
-) -> str:
-    """Create a String Representation of Frames in a Stack
+) -> Iterator[tuple[types.FrameType, str, int, str]]:
+    """Select the Frames in a Stack that Belong to a Package
 
     Args:
-        stack (list[inspect.FrameInfo]): Stack to represent.
-        package_name (str, optional): Name of the package to dump from the stack, otherwise non-exclusive if set to None. Defaults to None.
+        stack (list[inspect.FrameInfo]): Stack to select frames from.
+        package_name (str, optional): Name of the package to select frames from, otherwise non-exclusive if set to None. Defaults to None.
 
-    Returns:
-        str: Representation of the stack.
+    Yields:
+        tuple[types.FrameType, str, int, str]: Frame, filename, line number, and function name of each selected frame.
     """
-    msg = ""
-    modules = [inspect.getmodule(frame_record[0]) for frame_record in stack]
-    for i, (module, frame_record) in enumerate(zip(modules, stack)):
-        if module is None:
-            # Moduleless frame, e.g. dataclass.__init__
-            for j in reversed(range(i)):
-                if modules[j] is not None:
-                    break
-            else:
+    package_prefix = f"{package_name}." if package_name is not None else None
+    # Module scope of the most recent frame that had one
+    previous_module_name = None
+    for frame_record in stack:
+        # NOTE: Slicing accepts both inspect.FrameInfo and _FrameInfo records.
+        frame, filename, lineno, function = frame_record[:4]
+        # Module names are read from the frame globals rather than 'inspect.getmodule', which scans 'sys.modules'
+        module_name = frame.f_globals.get("__name__")
+        if module_name is None:
+            # Globals without a name (rare), e.g. code executed with bare globals
+            module = inspect.getmodule(frame)
+            if module is not None:
+                module_name = module.__name__
+
+        if module_name is None:
+            # Moduleless frame
+            if previous_module_name is None:
                 # No previous module scope
                 continue
 
-            module = modules[j]
+            module_name = previous_module_name
+        else:
+            previous_module_name = module_name
 
         # Only frames relating to the user's package if package_name is provided
-        if (package_name is None) or module.__name__.startswith(f"{package_name}.") or (module.__name__ == package_name):
-            locals_ = frame_record[0].f_locals
-            msg += f'Locals from file "{frame_record.filename}", line {frame_record.lineno}, in {frame_record.function}:\n'
-            for var_name in locals_:
-                var_value = locals_[var_name]
-                msg += f"  {var_name} {type(var_value)} = "
-                msg += pformat(var_name, var_value).replace("\n", "\n  ")
-                msg += "\n"
-
-            msg += "\n"
-            if ("self" in locals_) and hasattr(locals_["self"], "__dict__"):
-                msg += "Object dict:\n"
-                msg += repr(locals_["self"].__dict__)
-
-    return msg.rstrip("\n")
+        if (package_name is None) or (module_name == package_name) or module_name.startswith(package_prefix):
+            yield frame, filename, lineno, function
+
+
+def _stack_dump(
+    fp: io.TextIOBase,
+    stack: list[inspect.FrameInfo],
+    package_name: str | None = None,
+) -> None:
+    """Write the Representation of Frames in a Stack using a File Object
+
+    Args:
+        fp (io.TextIOBase): File object to use for writing.
+        stack (list[inspect.FrameInfo]): Stack to represent.
+        package_name (str, optional): Name of the package to dump from the stack, otherwise non-exclusive if set to None. Defaults to None.
+    """
+    # Fragments are batched per frame and handed to the file object in a single call
+    # NOTE: Joined and passed to 'write' (not 'writelines') since file objects are only required to have 'write'.
+    buf = []
+    write = buf.append
+    # Separator is written between frames (never after the last one)
+    separator = ""
+    for frame, filename, lineno, function in _package_frames(stack, package_name):
+        # NOTE: Accessing 'f_locals' copies the frame's variables, so it is only done for frames that are dumped.
+        locals_ = frame.f_locals
+        write(separator)
+        write(f'Locals from file "{filename}", line {lineno}, in {function}:')
+        for var_name, var_value in locals_.items():
+            write(f"\n  {var_name} {type(var_value)} = ")
+            _pformat_into(write, var_name, var_value, "  ")
+
+        if ("self" in locals_) and hasattr(locals_["self"], "__dict__"):
+            write("\n\nObject dict:\n")
+            write(repr(locals_["self"].__dict__))
+
+        fp.write("".join(buf))
+        buf.clear()
+        separator = "\n\n"
+
 
 def dumps(
     stack: list[inspect.FrameInfo],
@@ -347,7 +592,7 @@ def dumps(
 ) -> str:
     """Create a String Representation of an Interpreter Stack
 
-    Externalizes '_stack_dumps' to be accessed by the user.
+    Locals are only read from frames that are dumped, so providing 'package_name' also avoids copying the locals of unrelated frames.
 
     Args:
         stack (list[inspect.FrameInfo]): Stack of frames to represent.
@@ -357,9 +602,9 @@ def dumps(
     Returns:
         str: Representation of the stack.
     """
-    if e is None:
-        return _stack_dumps(stack=stack, package_name=package_name)
-    return _stack_dumps(stack=stack, package_name=package_name) + "\n\n" + _exception_dumps(e=e)
+    sio = io.StringIO()
+    dump(sio, stack, e=e, package_name=package_name)
+    return sio.getvalue()
 
 
 def dump(
@@ -371,16 +616,24 @@ def dump(
 ) -> None:
     """Write the Representation of an Interpreter Stack using a File Object
 
+    Without 'package_name', the locals of every frame in the stack are read and represented.
+
     Args:
         fp (io.TextIOBase | io.BytesIO): File object to use for writing.
         stack (list[inspect.FrameInfo]): Stack of frames to dump.
         e (Exception, optional): Exception that was raised. Defaults to None.
         package_name (str, optional): Name of the package to dump from the stack, otherwise non-exclusive if set to None. Defaults to None.
     """
-    result = dumps(stack, e=e, package_name=package_name)
     if isinstance(fp, io.BytesIO):
-        result = result.encode("utf-8")
-    fp.write(result)
+        # Binary file object (encode the complete representation)
+        fp.write(dumps(stack, e=e, package_name=package_name).encode("utf-8"))
+        return
+
+    # Text file object (write directly rather than copying through a string)
+    _stack_dump(fp, stack, package_name=package_name)
+    if e is not None:
+        fp.write("\n\n")
+        fp.write(_exception_dumps(e=e))
 
 
 def _dump(
@@ -399,23 +652,37 @@ def _dump(
     Returns:
         str: Path of the resulting dump.
     """
-    msg = dumps(stack, package_name=_global_package_name, e=e) + "\n"
     user_dump_path = dump_path or _global_dump_path
     if user_dump_path is not None:
         # User-provided path (assigned when user ran configure, or overridden in this method)
-        with open(_resolve_path(user_dump_path), mode="a", encoding="utf-8") as wf:
-            wf.write(msg)
-            return wf.name
+        path = _resolve_path(user_dump_path)
+        wf = open(path, mode="a", encoding="utf-8", buffering=_DUMP_BUFFER_SIZE)
     else:
         # Temporary file
-        with tempfile.NamedTemporaryFile(
-            "w",
+        fd, path = tempfile.mkstemp(
             # Fix the prefix if the user did not run 'configure'
             prefix=f"{_global_package_name}_stack_and_locals" if _global_package_name is not None else "stack_and_locals",
-            delete=False,
-        ) as wf:
-            wf.write(msg)
-            return wf.name
+        )
+        wf = os.fdopen(fd, mode="w", encoding="utf-8", buffering=_DUMP_BUFFER_SIZE)
+
+    # Stream the representation rather than building it in memory first
+    with wf:
+        # NOTE: Anything written before a failure is discarded (e.g. a local's '__repr__' raised),
+        #       unless the file is not seekable (e.g. '/dev/stderr' or a pipe), where it is left as is.
+        seekable = wf.seekable()
+        start = wf.tell() if seekable else None
+        try:
+            dump(wf, stack, e=e, package_name=_global_package_name)
+            wf.write("\n")
+        except BaseException:
+            if user_dump_path is not None:
+                if seekable:
+                    wf.truncate(start)
+            else:
+                wf.close()
+                os.unlink(path)
+            raise
+    return path
 
 @contextlib.contextmanager
 def dump_on_exception(
@@ -431,25 +698,37 @@ def dump_on_exception(
     try:
         yield
     except Exception as e:
-        trace = inspect.trace()
+        trace = _fast_trace(e.__traceback__)
         if len(trace) > 1:
             name = _dump(stack=trace[1:], e=e, dump_path=dump_path)
-            _logger.fatal(_DUMP_MSG.format(name=name))
+            _logger.fatal(name.join(_DUMP_MSG_PARTS))
 
         raise
 
 
+def _is_debug_enabled() -> bool:
+    """Check if the Global Logger Would Emit Debug Messages"""
+    # NOTE: The global logger is the 'logging' module (i.e. the root logger) until 'install' is run.
+    logger = logging.root if _logger is logging else _logger
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 def _set_levels(logger: logging.Logger, level: int) -> None:
     logger.setLevel(level)
+    debug = _is_debug_enabled()
     for handler in logger.handlers:
-        _logger.debug(f"Logger: {logger.name} - Setting log level for {handler.name} to {level}")
+        if debug:
+            _logger.debug(f"Logger: {logger.name} - Setting log level for {handler.name} to {level}")
         handler.setLevel(level)
 
 
 def _remove_handlers(logger: logging.Logger) -> None:
     """Remove All Handlers from an Instantiated Logger"""
-    for handler in logger.handlers:
-        _logger.debug(f"Logger: {logger.name} - Removing handler: {handler.name}")
+    debug = _is_debug_enabled()
+    # Iterate over a copy since handlers are removed from the list
+    for handler in logger.handlers[:]:
+        if debug:
+            _logger.debug(f"Logger: {logger.name} - Removing handler: {handler.name}")
         logger.removeHandler(handler)
 
 
@@ -470,6 +749,9 @@ def configure(
         dump_path (str | bytes | os.PathLike, optional): Custom path to use when dumping with 'dump_on_exception' or when 'dump_locals=True', otherwise use a temporary path if None. Defaults to None.
         remove_handlers (bool, optional): Remove existing logging handlers before adding the new stream handler. Defaults to True.
     """
+    # Relative paths may resolve differently if the working directory has changed
+    _resolve_path_cached.cache_clear()
+
     global _global_package_name
     _global_package_name = package_name
 
@@ -493,7 +775,7 @@ def configure(
 
     # Add a new stream handler
     handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(fmt=_LOG_FMT, datefmt=_DATE_FMT, style="{"))
+    handler.setFormatter(_FORMATTER)
     root_logger.addHandler(handler)
 
     # Set logging level for third-party libraries
@@ -510,6 +792,10 @@ def _resolve_path(path: str | bytes | os.PathLike) -> str:
     Returns:
         str: Resolved path-like object.
     """
+    if type(path) is str:
+        # Common case (already a string)
+        return _resolve_path_cached(path)
+
     if isinstance(path, bytes):
         path = path.decode("utf-8")
     elif not isinstance(path, str):
@@ -517,7 +803,25 @@ def _resolve_path(path: str | bytes | os.PathLike) -> str:
             path = path.__fspath__()
         except AttributeError:
             raise TypeError(f"Object is not path-like: {path!r}")
+        # NOTE: '__fspath__' may also return bytes.
+        if isinstance(path, bytes):
+            path = path.decode("utf-8")
+
+    return _resolve_path_cached(path)
 
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path_cached(path: str) -> str:
+    """Expand and Absolutize a String Path
+
+    Results depend on the working directory, so the cache is cleared by 'configure'.
+
+    Args:
+        path (str): Path to resolve.
+
+    Returns:
+        str: Resolved path.
+    """
     # Expand "~" and "~user" constructions
     path = os.path.expanduser(path)
 
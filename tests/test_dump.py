@@ -0,0 +1,127 @@
+# Copyright Nicholas Londowski 2022. Apache 2.0 license, see LICENSE file.
+import inspect
+import os
+import tempfile
+import threading
+import yogger
+import unittest
+
+from unittest import mock
+
+
+class _Thing:
+    def __init__(self):
+        self.value = 1
+
+    def method(self, arg):
+        local_value = [1, 2]
+        return yogger.dumps(inspect.stack()[:2], package_name=__name__)
+
+
+class _BadRepr:
+    def __repr__(self):
+        raise RuntimeError("repr failed")
+
+
+def _raise_with_bad_local(dump_path=None):
+    with yogger.dump_on_exception(dump_path=dump_path):
+        bad_value = _BadRepr()
+        raise ValueError("original")
+
+
+def _raise_in_dump_context(dump_path=None):
+    with yogger.dump_on_exception(dump_path=dump_path):
+        value = 1
+        raise ValueError("original")
+
+
+def _outer():
+    thing = _Thing()
+    return thing.method("a")
+
+
+class DumpTest(unittest.TestCase):
+    def test_dumps(self):
+        result_actual = _outer()
+        frames = result_actual.split("\n\nLocals from file ")
+        self.assertEqual(len(frames), 2)
+        # Method frame (includes the object dict)
+        lines = frames[0].split("\n")
+        self.assertEqual(lines[0], f'Locals from file "{__file__}", line {_Thing.method.__code__.co_firstlineno + 2}, in method:')
+        self.assertTrue(lines[1].startswith(f"  self {_Thing} = self = <{__name__}._Thing object at "), msg=repr(lines[1]))
+        self.assertEqual(lines[2], "  arg <class 'str'> = arg = 'a'")
+        self.assertEqual(lines[3], "  local_value <class 'list'> = local_value = [1, 2]")
+        self.assertEqual(lines[4:], ["", "Object dict:", "{'value': 1}"])
+        # Calling frame (separated by a blank line, no trailing newline)
+        lines = frames[1].split("\n")
+        self.assertEqual(lines[0], f'"{__file__}", line {_outer.__code__.co_firstlineno + 2}, in _outer:')
+        self.assertTrue(lines[1].startswith(f"  thing {_Thing} = thing = <{__name__}._Thing object at "), msg=repr(lines[1]))
+        self.assertEqual(len(lines), 2)
+
+    def test_dump_write_only(self):
+        class WriteOnly:
+            def __init__(self):
+                self.parts = []
+
+            def write(self, s):
+                self.parts.append(s)
+
+        # Only 'write' is required of the file object
+        fp = WriteOnly()
+        yogger.dump(fp, inspect.stack()[:1], package_name=__name__)
+        self.assertTrue("".join(fp.parts).startswith('Locals from file "'))
+
+    def test_dump_failure_user_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dump_path = os.path.join(tmpdir, "dump.txt")
+            with open(dump_path, mode="w", encoding="utf-8") as wf:
+                wf.write("previous dump\n")
+            with self.assertRaises(RuntimeError):
+                _raise_with_bad_local(dump_path=dump_path)
+            # Partial record is discarded (earlier dumps are kept)
+            with open(dump_path, encoding="utf-8") as rf:
+                self.assertEqual(rf.read(), "previous dump\n")
+
+    def test_dump_failure_temporary_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(tempfile, "tempdir", tmpdir):
+                with self.assertRaises(RuntimeError):
+                    _raise_with_bad_local()
+            # Temporary file is removed
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    @unittest.skipUnless(os.path.isdir("/dev/fd"), "requires /dev/fd")
+    def test_dump_unseekable_path(self):
+        def dump_to_pipe(func):
+            read_fd, write_fd = os.pipe()
+            chunks = []
+
+            def drain():
+                with os.fdopen(read_fd, mode="rb") as rf:
+                    chunks.append(rf.read())
+
+            # Drain the pipe while dumping (the dump may be larger than the pipe buffer)
+            reader = threading.Thread(target=drain)
+            reader.start()
+            try:
+                func(f"/dev/fd/{write_fd}")
+            finally:
+                os.close(write_fd)
+                reader.join()
+            return b"".join(chunks).decode("utf-8")
+
+        def expect_raises(exc_type, func):
+            def run(dump_path):
+                # NOTE: 'io.UnsupportedOperation' is also a 'ValueError', so the type must match exactly.
+                with self.assertRaises(exc_type) as cm:
+                    func(dump_path)
+                self.assertIs(type(cm.exception), exc_type)
+
+            return run
+
+        # Dumps to unseekable files and the user's exception is raised
+        result_actual = dump_to_pipe(expect_raises(ValueError, _raise_in_dump_context))
+        self.assertIn("  value <class 'int'> = value = 1", result_actual)
+        self.assertTrue(result_actual.endswith("builtins.ValueError: original\n  args: ('original',)\n"), msg=repr(result_actual[-200:]))
+        # Formatting error is raised (rather than failing to rewind the pipe)
+        dump_to_pipe(expect_raises(RuntimeError, _raise_with_bad_local))
@@ -0,0 +1,25 @@
+# Copyright Nicholas Londowski 2022. Apache 2.0 license, see LICENSE file.
+import logging
+import unittest
+
+from yogger import base
+
+
+class LoggingTest(unittest.TestCase):
+    def test_remove_handlers(self):
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers[:]
+
+        def restore_handlers():
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+            for handler in handlers:
+                root_logger.addHandler(handler)
+
+        self.addCleanup(restore_handlers)
+        # Every handler must be removed (not every other one)
+        for _ in range(3):
+            root_logger.addHandler(logging.NullHandler())
+        self.assertGreaterEqual(len(root_logger.handlers), 3)
+        base._remove_handlers(root_logger)
+        self.assertEqual(root_logger.handlers, [])
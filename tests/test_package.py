@@ -0,0 +1,30 @@
+# Copyright Nicholas Londowski 2022. Apache 2.0 license, see LICENSE file.
+import subprocess
+import sys
+import unittest
+
+
+class PackageTest(unittest.TestCase):
+    def _run(self, code):
+        # Fresh interpreter so that modules imported by other tests do not leak in
+        return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+    def test_lazy_import(self):
+        result_actual = self._run("import sys, yogger; print([m for m in ('yogger.base', 'typing', 'inspect') if m in sys.modules])")
+        self.assertEqual(result_actual, "[]")
+        # Names used only at import time are not exposed
+        result_actual = self._run("import yogger; print([n for n in dir(yogger) if not n.startswith('_')])")
+        self.assertEqual(
+            result_actual,
+            "['Yogger', 'configure', 'dump', 'dump_on_exception', 'dumps', 'install', 'lazy_pformat', 'pformat']",
+        )
+
+    def test_star_import(self):
+        result_actual = self._run(
+            "from yogger import *; "
+            "print(sorted(n for n in ('Yogger', 'configure', 'dump', 'dump_on_exception', 'dumps', 'install', 'lazy_pformat', 'pformat') if n in globals()))"
+        )
+        self.assertEqual(
+            result_actual,
+            "['Yogger', 'configure', 'dump', 'dump_on_exception', 'dumps', 'install', 'lazy_pformat', 'pformat']",
+        )